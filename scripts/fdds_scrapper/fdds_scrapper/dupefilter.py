@@ -0,0 +1,34 @@
+from pybloom_live import ScalableBloomFilter
+from scrapy.dupefilters import RFPDupeFilter
+
+
+class BloomDupeFilter(RFPDupeFilter):
+    """
+    Request duplicates filter backed by a scalable Bloom filter.
+
+    Keeps request fingerprints in a Bloom filter instead of a set of strings,
+    which needs a few bits per request regardless of the URL length.
+    A small fraction of never-seen requests (`error_rate`) may be reported
+    as duplicates. Seen requests are not persisted to `JOBDIR`.
+    """
+
+    def __init__(self, path=None, debug=False, *, fingerprinter=None):
+        super().__init__(path, debug, fingerprinter=fingerprinter)
+        self.seen = ScalableBloomFilter(initial_capacity=1 << 18, error_rate=1e-5)
+
+    def request_seen(self, request):
+        """
+        Check whether the request was already scheduled and remember it if not.
+
+        Args:
+            request (scrapy.Request):
+                The request to check.
+
+        Returns:
+            bool: True if the request was seen before, False otherwise.
+        """
+        fingerprint = self.request_fingerprint(request)
+        if fingerprint in self.seen:
+            return True
+        self.seen.add(fingerprint)
+        return False
@@ -0,0 +1,27 @@
+from scrapy.exporters import BaseItemExporter
+
+
+class LinesItemExporter(BaseItemExporter):
+    """
+    Item exporter writing the first exported field of each item as a plain line.
+
+    Unlike the CSV exporter, values are neither quoted nor terminated with CRLF,
+    so the output can be read line by line, e.g. by `manage_pdfs.py`.
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+        self.encoding = self.encoding or "utf-8"
+
+    def export_item(self, item):
+        """
+        Write the first exported field of the item as a single line.
+
+        Args:
+            item (dict):
+                The scraped item.
+        """
+        fields = self.get_serialized_fields(item, default_value="")
+        _, value = next(iter(fields), (None, ""))
+        self.file.write(f"{value}\n".encode(self.encoding))
@@ -5,5 +5,28 @@ NEWSPIDER_MODULE = "fdds_scrapper.spiders"
 
 ROBOTSTXT_OBEY = True
 
+LOG_LEVEL = "INFO"
+
+DUPEFILTER_CLASS = "fdds_scrapper.dupefilter.BloomDupeFilter"
+
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
+
+FEED_EXPORTERS = {"lines": "fdds_scrapper.exporters.LinesItemExporter"}
+FEEDS = {
+    "pdfs.txt": {
+        "format": "lines",
+        "fields": ["pdf_url"],
+        "overwrite": False,
+        "store_empty": False,
+    },
+}
+
+# Concurrency: the crawl is I/O-bound, so keep many requests in flight
+CONCURRENT_REQUESTS = 64
+CONCURRENT_REQUESTS_PER_DOMAIN = 32
+DOWNLOAD_DELAY = 0
+REACTOR_THREADPOOL_MAXSIZE = 20
+DOWNLOAD_TIMEOUT = 120
+RETRY_TIMES = 2
+AUTOTHROTTLE_ENABLED = False
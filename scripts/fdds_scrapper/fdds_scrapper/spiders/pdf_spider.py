@@ -30,7 +30,7 @@ class RegionMainSpider(scrapy.Spider):
         The response is passed to the `parse` method.
         """
         for url in self.start_urls:
-            yield scrapy.Request(url, meta={"playwright": True}, callback=self.parse)
+            yield scrapy.Request(url, callback=self.parse)
 
     def parse(self, response, **kwargs: Any):
         """
@@ -46,14 +46,16 @@ class RegionMainSpider(scrapy.Spider):
         """
         urls = response.css("#region-main a::attr(href)").getall()
 
+        seen = set()
         for url in urls:
             absolute_url = response.urljoin(url)
-            print(absolute_url)
+            if absolute_url in seen:
+                continue
+            seen.add(absolute_url)
+            self.logger.debug("Follow %s", absolute_url)
             yield scrapy.Request(
                 absolute_url,
-                meta={"playwright": True},
                 callback=self.check_for_pdfs,
-                dont_filter=True,
             )
 
     def check_for_pdfs(self, response):
@@ -73,7 +75,47 @@ class RegionMainSpider(scrapy.Spider):
 
         for link in links:
             absolute_url = response.urljoin(link)
-            yield scrapy.Request(absolute_url, callback=self.check_if_pdf)
+            yield self.content_type_request(absolute_url, callback=self.check_if_pdf)
+
+    def content_type_request(self, url, callback):
+        """
+        Build a cheap request used only to sniff the `Content-Type` of a link.
+
+        The request uses the HEAD method, since only the response headers
+        are needed. Servers answering HEAD with
+        405 Method Not Allowed are retried with a plain GET by the callback.
+
+        Args:
+            url (str):
+                The absolute URL to check.
+            callback (Callable):
+                The callback receiving the response.
+
+        Returns:
+            scrapy.Request: The HEAD request for the given URL.
+        """
+        return scrapy.Request(
+            url,
+            method="HEAD",
+            callback=callback,
+            meta={"handle_httpstatus_list": [405]},
+        )
+
+    def retry_with_get(self, response):
+        """
+        Retry a HEAD request rejected with 405 as a GET.
+
+        Args:
+            response (scrapy.http.Response):
+                The 405 response to the HEAD request.
+
+        Returns:
+            scrapy.Request | None:
+                The GET request, or None if the response does not need a retry.
+        """
+        if response.status != 405 or response.request.method != "HEAD":
+            return None
+        return response.request.replace(method="GET", meta={})
 
     def check_if_pdf(self, response):
         """
@@ -81,7 +123,8 @@ class RegionMainSpider(scrapy.Spider):
 
         This method checks the `Content-Type` of the response to
         determine if it's a PDF. If the content type is `application/pdf`,
-        it saves the URL in a file called `pdfs.txt`.
+        it yields the URL as an item, which the feed exporter saves
+        in a file called `pdfs.txt`.
         If the content type is not a PDF, it performs double-check by
         following additional links on the page.
 
@@ -89,12 +132,16 @@ class RegionMainSpider(scrapy.Spider):
             response (scrapy.http.Response):
                 The response object containing the content of the PDF or another page.
         """
+        retry = self.retry_with_get(response)
+        if retry:
+            yield retry
+            return
+
         content_type = response.headers.get("Content-Type")
         if content_type and b"application/pdf" in content_type:
-            with open("pdfs.txt", "a+") as f:
-                f.write(response.url + "\n")
+            yield {"pdf_url": response.url}
         else:
-            print(f"Performing double check for: {response.url}")
+            self.logger.debug("Performing double check for: %s", response.url)
             yield scrapy.Request(
                 response.url,
                 dont_filter=True,
@@ -115,9 +162,15 @@ class RegionMainSpider(scrapy.Spider):
                 The response object containing the HTML content of the page.
         """
         links = response.css("#region-main a::attr(href)").getall()
+        seen = set()
         for link in links:
             absolute_url = response.urljoin(link)
-            yield scrapy.Request(absolute_url, callback=self.last_check_if_pdf)
+            if absolute_url in seen:
+                continue
+            seen.add(absolute_url)
+            yield self.content_type_request(
+                absolute_url, callback=self.last_check_if_pdf
+            )
 
     def last_check_if_pdf(self, response):
         """
@@ -125,13 +178,17 @@ class RegionMainSpider(scrapy.Spider):
 
         This is the last step in the double-check process.
         If a page is found to be a PDF after additional checks,
-        the URL will be saved to `pdfs.txt`
+        the URL is yielded as an item and saved to `pdfs.txt` by the feed exporter.
 
         Args:
             response (scrapy.http.Response):
                 The response object containing the content of the page.
         """
+        retry = self.retry_with_get(response)
+        if retry:
+            yield retry
+            return
+
         content_type = response.headers.get("Content-Type")
         if content_type and b"application/pdf" in content_type:
-            with open("pdfs.txt", "a+") as f:
-                f.write(response.url + "\n")
+            yield {"pdf_url": response.url}
@@ -1,4 +1,6 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 
 from ragbits.chat.interface import ChatInterface
 from ragbits.chat.interface.types import (
@@ -10,7 +12,8 @@ from ragbits.core import audit
 from ragbits.core.prompt import ChatFormat
 
 from fdds import config
-from fdds.inference import inference
+from fdds.cache import SemanticResponseCache, TTLCache, conversation_key
+from fdds.inference import get_clients, inference, warmup
 
 # Conditionally setup Jaeger tracing
 if config.JAEGER_ENABLED:
@@ -23,7 +26,13 @@ if config.JAEGER_ENABLED:
 
     provider = TracerProvider(resource=Resource({SERVICE_NAME: "FDDS-RAG-INFERENCE"}))
     provider.add_span_processor(
-        BatchSpanProcessor(OTLPSpanExporter(config.JAEGER_URL, insecure=True))
+        BatchSpanProcessor(
+            OTLPSpanExporter(config.JAEGER_URL, insecure=True),
+            max_queue_size=16384,
+            schedule_delay_millis=5000,
+            max_export_batch_size=1024,
+            export_timeout_millis=2000,
+        )
     )
     trace.set_tracer_provider(provider)
     audit.set_trace_handlers("otel")
@@ -33,6 +42,28 @@ else:
         return func
 
 
+response_cache: TTLCache[str, list[str]] = TTLCache(
+    config.RESPONSE_CACHE_SIZE, config.RESPONSE_CACHE_TTL
+)
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> SemanticResponseCache | None:
+    """
+    Returns the semantic response cache sharing the inference clients,
+    or None if it is disabled.
+    """
+    if not config.SEMANTIC_CACHE_ENABLED:
+        return None
+    clients = get_clients()
+    return SemanticResponseCache(
+        client=clients.qdrant_client,
+        embedder=clients.embedder,
+        collection_name=config.SEMANTIC_CACHE_COLLECTION_NAME,
+        score_threshold=config.SEMANTIC_CACHE_THRESHOLD,
+    )
+
+
 class MyChat(ChatInterface):
     """Implementation of the ChatInterface."""
 
@@ -50,6 +81,10 @@ class MyChat(ChatInterface):
         """,
     )
 
+    async def setup(self) -> None:
+        """Warms up the inference clients before the first request."""
+        await warmup()
+
     @traceable
     async def chat(
         self,
@@ -57,5 +92,25 @@ class MyChat(ChatInterface):
         history: ChatFormat,
         context: ChatContext,
     ) -> AsyncGenerator[ChatResponse, None]:
-        async for chunk in inference([*history, {"role": "user", "content": message}]):
+        conversation = [*history, {"role": "user", "content": message}]
+        key = conversation_key(conversation)
+        cached_chunks = response_cache.get(key)
+        semantic_cache = get_semantic_cache()
+        vector = None
+        if cached_chunks is None and semantic_cache is not None:
+            history_key = conversation_key(history)
+            vector = await semantic_cache.embed(message)
+            cached_chunks = await semantic_cache.get(vector, history_key)
+        if cached_chunks is not None:
+            for chunk in cached_chunks:
+                yield self.create_text_response(chunk)
+                await asyncio.sleep(0)
+            return
+
+        chunks = []
+        async for chunk in inference(conversation):
+            chunks.append(chunk)
             yield self.create_text_response(chunk)
+        response_cache.set(key, chunks)
+        if vector is not None:
+            await semantic_cache.set(vector, history_key, chunks)
@@ -1,5 +1,5 @@
-from fdds.config import Config
+from fdds.config import get_config
 
-config = Config()
+config = get_config()
 
 _all_ = ["config"]
@@ -0,0 +1,278 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from hashlib import blake2b
+from typing import Generic, Hashable, ParamSpec, TypeVar
+from uuid import uuid4
+
+import orjson
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointStruct,
+    VectorParams,
+)
+from ragbits.core.embeddings import Embedder
+from ragbits.core.prompt import ChatFormat
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+P = ParamSpec("P")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded in-process cache evicting the least recently used entries.
+
+    Attributes:
+        max_size (int): The maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """
+        Returns the cached value and marks it as the most recently used.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if the key is not cached.
+        """
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Stores the value, evicting the least recently used entry if full.
+
+        Args:
+            key (K): The key to store the value under.
+            value (V): The value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class TTLCache(LRUCache[K, V]):
+    """
+    An LRU cache whose entries additionally expire after a fixed time.
+
+    Attributes:
+        max_size (int): The maximum number of entries kept in the cache.
+        ttl (float): The number of seconds an entry stays valid.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        super().__init__(max_size)
+        self.ttl = ttl
+
+    def get(self, key: K) -> V | None:
+        """
+        Returns the cached value if it has not expired yet.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if the key is missing or expired.
+        """
+        entry = super().get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Stores the value for `ttl` seconds, evicting the least recently used
+        entry if full.
+
+        Args:
+            key (K): The key to store the value under.
+            value (V): The value to store.
+        """
+        super().set(key, (time.monotonic() + self.ttl, value))  # type: ignore[arg-type]
+
+
+def async_ttl_cache(
+    max_size: int, ttl: float
+) -> Callable[[Callable[P, Awaitable[V]]], Callable[P, Awaitable[V]]]:
+    """
+    Caches the results of a coroutine function in a `TTLCache`
+    keyed by its arguments.
+
+    Args:
+        max_size (int): The maximum number of cached results.
+        ttl (float): The number of seconds a result stays valid.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable[P, Awaitable[V]]) -> Callable[P, Awaitable[V]]:
+        cache: TTLCache[Hashable, V] = TTLCache(max_size, ttl)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> V:
+            key = (args, tuple(sorted(kwargs.items())))
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            result = await func(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def conversation_key(conversation: ChatFormat) -> str:
+    """
+    Computes a stable hash of the conversation to be used as a cache key.
+
+    Args:
+        conversation (ChatFormat): The conversation, including the last message.
+
+    Returns:
+        str: The hex digest identifying the conversation.
+    """
+    payload = orjson.dumps(conversation, option=orjson.OPT_SORT_KEYS)
+    return blake2b(payload).hexdigest()
+
+
+class SemanticResponseCache:
+    """
+    A response cache matching user messages by embedding similarity.
+
+    Responses are stored in a dedicated Qdrant collection, keyed by the
+    embedding of the user message and the hash of the preceding history,
+    so that near-duplicate questions asked in the same context reuse the
+    previously generated answer.
+
+    Attributes:
+        client (AsyncQdrantClient): The Qdrant client storing the cache entries.
+        embedder (Embedder): The embedder used to vectorize user messages.
+        collection_name (str): The name of the Qdrant collection with the entries.
+        score_threshold (float): The minimal similarity for a cache hit.
+    """
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        embedder: Embedder,
+        collection_name: str,
+        score_threshold: float,
+    ):
+        self.client = client
+        self.embedder = embedder
+        self.collection_name = collection_name
+        self.score_threshold = score_threshold
+        self._collection_ready = False
+        self._lock = asyncio.Lock()
+
+    async def _ensure_collection(self, vector_size: int) -> None:
+        """
+        Creates the cache collection if it does not exist yet.
+
+        Args:
+            vector_size (int): The size of the message embeddings.
+        """
+        if self._collection_ready:
+            return
+        async with self._lock:
+            if self._collection_ready:
+                return
+            if not await self.client.collection_exists(self.collection_name):
+                await self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=VectorParams(
+                        size=vector_size, distance=Distance.COSINE
+                    ),
+                )
+            self._collection_ready = True
+
+    async def embed(self, message: str) -> list[float]:
+        """
+        Embeds the user message.
+
+        Args:
+            message (str): The user message.
+
+        Returns:
+            list[float]: The embedding of the message.
+        """
+        (vector,) = await self.embedder.embed_text([message])
+        return vector
+
+    async def get(self, vector: list[float], history_key: str) -> list[str] | None:
+        """
+        Looks up a response to a similar message asked after the same history.
+
+        Args:
+            vector (list[float]): The embedding of the user message.
+            history_key (str): The hash of the history preceding the message.
+
+        Returns:
+            list[str] | None: The cached response chunks, or None on a miss.
+        """
+        await self._ensure_collection(len(vector))
+        result = await self.client.query_points(
+            collection_name=self.collection_name,
+            query=vector,
+            query_filter=Filter(
+                must=[
+                    FieldCondition(
+                        key="history_hash", match=MatchValue(value=history_key)
+                    )
+                ]
+            ),
+            limit=1,
+            score_threshold=self.score_threshold,
+            with_payload=True,
+        )
+        if not result.points:
+            return None
+        return result.points[0].payload["chunks"]
+
+    async def set(
+        self, vector: list[float], history_key: str, chunks: list[str]
+    ) -> None:
+        """
+        Stores the response generated for the message.
+
+        Args:
+            vector (list[float]): The embedding of the user message.
+            history_key (str): The hash of the history preceding the message.
+            chunks (list[str]): The streamed response chunks.
+        """
+        await self._ensure_collection(len(vector))
+        await self.client.upsert(
+            collection_name=self.collection_name,
+            points=[
+                PointStruct(
+                    id=str(uuid4()),
+                    vector=vector,
+                    payload={"history_hash": history_key, "chunks": chunks},
+                )
+            ],
+        )
@@ -1,9 +1,13 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
-from pydantic import PositiveInt
+from pydantic import PositiveFloat, PositiveInt
 from pydantic_settings import BaseSettings
 
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
 
 class Config(BaseSettings):
     """
@@ -20,6 +24,8 @@ class Config(BaseSettings):
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     MODEL_NAME: str = "gpt-4o-mini"
     MAX_NEW_TOKENS: PositiveInt = 500
+    RERANKER_BACKEND: Literal["llm", "onnx"] = "llm"
+    ONNX_RERANKER_PATH: Path = _BASE_DIR / "models" / "bge-reranker-v2-m3"
 
     # API
     API_URL: str = "http://localhost:8000"
@@ -27,19 +33,54 @@ class Config(BaseSettings):
     # DATA
     QDRANT_URL: str = "http://localhost"  # "http://qdrant"
     QDRANT_PORT: int = 6333
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_PREFER_GRPC: bool = True
     QDRANT_INGEST_URL: str = "http://localhost"
     COLLECTION_NAME: str = "fdds"
 
-    EVAL_DATASET: Path = (
-        Path(__file__).parent.parent.parent / "data" / "eval_dataset.json"
-    )
-    EVAL_CONFIG: Path = (
-        Path(__file__).parent.parent.parent / "data" / "eval_config.yaml"
-    )
+    EVAL_DATASET: Path = _BASE_DIR / "data" / "eval_dataset.json"
+    EVAL_CONFIG: Path = _BASE_DIR / "data" / "eval_config.yaml"
+
+    # INGESTION
+    URL_FETCH_CONCURRENCY: PositiveInt = 32
+    HTTP_CACHE_DIR: Path | None = None
+    HTTP_CACHE_MAX_BYTES: PositiveInt | None = 2 * 1024**3
+    PDF_HEAD_CHECK: bool = True
+    MAX_PDF_BYTES: PositiveInt = 100 * 1024 * 1024
+    QDRANT_INGEST_TIMEOUT: PositiveInt = 120
+    INGEST_BATCH_SIZE: PositiveInt = 32
+    INGEST_CONCURRENCY: PositiveInt = 4
+    PARSE_WORKERS: PositiveInt = 2
+    PDF_PARSER: Literal["pypdf", "docling"] = "pypdf"
+    PDF_OCR_FALLBACK: bool = True
+    EMBEDDING_BATCH_SIZE: PositiveInt = 2048
+    EMBEDDING_CONCURRENCY: PositiveInt = 8
+    QDRANT_UPLOAD_BATCH_SIZE: PositiveInt = 256
+    QDRANT_UPLOAD_CONCURRENCY: PositiveInt = 4
+    BULK_MODE: bool = False
+    INCREMENTAL_INGEST: bool = False
+    INDEXING_THRESHOLD: PositiveInt = 20000
+    QDRANT_INT8_QUANTIZATION: bool = True
+    QDRANT_FLOAT16_VECTORS: bool = True
+    QDRANT_SHARD_NUMBER: PositiveInt | None = None
 
     # RETRIEVE PARAMETERS
     TOP_K: PositiveInt = 5
-    TOP_N: PositiveInt = 5
+    TOP_N: PositiveInt | None = 5
+
+    # STREAMING
+    STREAM_BATCH_SIZE: PositiveInt = 8
+    STREAM_BATCH_INTERVAL: PositiveFloat = 0.05
+    STREAM_BATCH_CHARS: PositiveInt = 256
+
+    # CACHE
+    RESPONSE_CACHE_SIZE: PositiveInt = 1024
+    RESPONSE_CACHE_TTL: PositiveFloat = 3600
+    QUERY_CACHE_SIZE: PositiveInt = 4096
+    QUERY_CACHE_TTL: PositiveFloat = 300
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_COLLECTION_NAME: str = "chat_response_cache"
+    SEMANTIC_CACHE_THRESHOLD: float = 0.97
 
     # LOGS AND MONITORING
     JAEGER_ENABLED: bool = False
@@ -47,6 +88,18 @@ class Config(BaseSettings):
     logging.getLogger("LiteLLM").setLevel(logging.WARNING)
 
     class Config:
-        env_file = Path(__file__).parent.parent.parent / ".env"
+        env_file = _BASE_DIR / ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
+        env_parse_none_str = "none"
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the application configuration, validated once per process.
+
+    Returns:
+        Config: The shared configuration instance.
+    """
+    return Config()
@@ -0,0 +1,121 @@
+import asyncio
+from itertools import chain
+
+from ragbits.core.embeddings import LiteLLMEmbedder
+from ragbits.core.embeddings.dense.litellm import LiteLLMEmbedderOptions
+
+from fdds.cache import TTLCache
+
+
+class QueryEmbedder(LiteLLMEmbedder):
+    """
+    LiteLLM embedder for search queries.
+
+    Embeddings of single texts are kept in a TTL cache at full precision,
+    so repeated queries skip the embedding API call and retrieve exactly
+    what the first one did. A text can also be
+    prefetched, i.e. embedded in the background ahead of the search that
+    needs it; the next `embed_text` call for exactly that text reuses it.
+    """
+
+    def __init__(self, *args, cache_size: int, cache_ttl: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: TTLCache[str, list[float]] = TTLCache(cache_size, cache_ttl)
+        self._prefetched: dict[str, asyncio.Future[list[list[float]]]] = {}
+
+    def prefetch(self, text: str) -> None:
+        """
+        Starts embedding the text in the background.
+
+        Args:
+            text (str): The text to embed.
+        """
+        if text not in self._prefetched and self._cache.get(text) is None:
+            self._prefetched[text] = asyncio.ensure_future(super().embed_text([text]))
+
+    def discard(self, text: str) -> None:
+        """
+        Drops the prefetched embedding of the text if it is not needed anymore.
+
+        Args:
+            text (str): The text passed to `prefetch`.
+        """
+        future = self._prefetched.pop(text, None)
+        if future is None:
+            return
+        if future.done() and not future.cancelled():
+            future.exception()
+        future.cancel()
+
+    async def embed_text(
+        self, data: list[str], options: LiteLLMEmbedderOptions | None = None
+    ) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings, reusing a cached or
+        prefetched one for a single string.
+
+        Args:
+            data (list[str]): The strings to embed.
+            options (LiteLLMEmbedderOptions | None): Additional embedding options.
+
+        Returns:
+            list[list[float]]: The embeddings of the strings.
+        """
+        if len(data) != 1 or options is not None:
+            return await super().embed_text(data, options)
+
+        (text,) = data
+        cached = self._cache.get(text)
+        if cached is not None:
+            return [list(cached)]
+
+        prefetched = self._prefetched.pop(text, None)
+        if prefetched is not None:
+            embeddings = await prefetched
+        else:
+            embeddings = await super().embed_text(data)
+        self._cache.set(text, list(embeddings[0]))
+        return embeddings
+
+
+class ConcurrentLiteLLMEmbedder(LiteLLMEmbedder):
+    """
+    LiteLLM embedder for bulk ingestion.
+
+    Large inputs are split into batches of at most `batch_size` strings,
+    which are sent concurrently, with at most `concurrency` requests in flight.
+    """
+
+    def __init__(self, *args, batch_size: int, concurrency: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _embed_batch(
+        self, data: list[str], options: LiteLLMEmbedderOptions | None
+    ) -> list[list[float]]:
+        async with self._semaphore:
+            return await super().embed_text(data, options)
+
+    async def embed_text(
+        self, data: list[str], options: LiteLLMEmbedderOptions | None = None
+    ) -> list[list[float]]:
+        """
+        Creates embeddings for the given strings, batch by batch.
+
+        Args:
+            data (list[str]): The strings to embed.
+            options (LiteLLMEmbedderOptions | None): Additional embedding options.
+
+        Returns:
+            list[list[float]]: The embeddings of the strings, in the input order.
+        """
+        starts = range(0, len(data), self.batch_size)
+        ends = range(self.batch_size, len(data) + self.batch_size, self.batch_size)
+        results = await asyncio.gather(
+            *(
+                self._embed_batch(data[start:end], options)
+                for start, end in zip(starts, ends)
+            )
+        )
+        return list(chain.from_iterable(results))
@@ -1,133 +1,124 @@
 import asyncio
 import logging
 import sys
+from collections.abc import KeysView
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import AsyncGenerator
 
-from pydantic import BaseModel
 from qdrant_client import AsyncQdrantClient
-from ragbits.chat.history.compressors.llm import (
-    LastMessageAndHistory,
-    StandaloneMessageCompressor,
-)
-from ragbits.core.embeddings import LiteLLMEmbedder
+from ragbits.chat.history.compressors.llm import StandaloneMessageCompressor
 from ragbits.core.llms.litellm import LiteLLM, LiteLLMOptions
-from ragbits.core.prompt import ChatFormat, Prompt
+from ragbits.core.prompt import ChatFormat
+from ragbits.core.vector_stores.base import VectorStoreOptions
 from ragbits.core.vector_stores.qdrant import QdrantVectorStore
 from ragbits.document_search import DocumentSearch, DocumentSearchOptions
 from ragbits.document_search.documents.element import Element
+from ragbits.document_search.retrieval.rerankers.base import Reranker
 
 from fdds import config
-from fdds.reranker import LLMReranker
+from fdds.cache import async_ttl_cache
+from fdds.embedders import QueryEmbedder
+from fdds.prompts import CompressorPrompt, QueryWithContext, RAGPrompt
+from fdds.reranker import LLMReranker, ONNXReranker
+from fdds.runner import run
+from fdds.streaming import batched_stream
+from fdds.vector_stores import QDRANT_GRPC_OPTIONS
 
 logger = logging.getLogger(__name__)
 options = LiteLLMOptions(max_tokens=config.MAX_NEW_TOKENS)
 
 
-class QueryWithContext(BaseModel):
+@dataclass
+class _Clients:
     """
-    Represents a query with associated context for
-    retrieval-augmented generation workflows.
-
-    This class models a user query along with a list of context strings.
-    The context provides relevant background information
-    that the assistant can use to generate a response.
-
-    Attributes:
-        query (str): The user's question or input.
-        context (list[str]):
-        A list of context strings containing information relevant to the query.
-
-    """
-
-    query: str
-    context: list[str]
-
-
-class RAGPrompt(Prompt[QueryWithContext]):
-    """
-    A prompt template for a retrieval-augmented generation (RAG) assistant.
-
-    This class defines both the system and user prompts for guiding
-    the assistant's behavior. The assistant answers questions using
-    the provided context and refuses to answer
-    if the context lacks enough information.
-
-    Attributes:
-        system_prompt (str): The system-level instructions for the assistant.
-        user_prompt (str): The template for rendering the user's query and context.
-
+    Clients shared by all inference calls within the process.
     """
 
-    system_prompt = """
-    You are a helpful assistant.
-    Answer the QUESTION that will be provided using CONTEXT.
-    If the QUESTION asks where something is located,
-    if possible, try to provide the file url.
-
-    DO NOT INFORM THAT INFORMATION IS PROVIDED IN CONTEXT!
-    If in the given CONTEXT there is not enough information refuse to answer.
-    """
+    embedder: QueryEmbedder
+    reranker: Reranker
+    qdrant_client: AsyncQdrantClient
+    vector_store: QdrantVectorStore
+    document_search: DocumentSearch
+    llm: LiteLLM
 
-    user_prompt = """
-    QUESTION:
-    {{ query }}
 
-    CONTEXT:
-    {% for item in context %}
-        {{ item }}
-    {% endfor %}
+@lru_cache(maxsize=1)
+def get_clients() -> _Clients:
     """
+    Builds the embedder, reranker, Qdrant client, vector store, document search
+    and LLM on first use and returns the same instances afterwards.
 
+    It should be first called from within the running event loop, so that
+    the connection pools of the clients are bound to that loop. Construction
+    does not await, so concurrent callers cannot interleave while building.
 
-class CompressorPrompt(Prompt[LastMessageAndHistory, str]):
-    """
-    A prompt for recontextualizing the last message in the history.
+    Returns:
+        _Clients: The shared clients.
     """
+    embedder = QueryEmbedder(
+        model_name=config.EMBEDDING_MODEL,
+        cache_size=config.QUERY_CACHE_SIZE,
+        cache_ttl=config.QUERY_CACHE_TTL,
+    )
+    llm = LiteLLM(
+        model_name=config.MODEL_NAME,
+        api_key=config.OPENAI_API_KEY,
+        default_options=options,
+    )
+    if config.RERANKER_BACKEND == "onnx":
+        reranker = ONNXReranker(model_path=config.ONNX_RERANKER_PATH)
+    else:
+        reranker = LLMReranker(
+            model_name=config.MODEL_NAME,
+            llm=llm,
+        )
+    qdrant_client = AsyncQdrantClient(
+        url=config.QDRANT_URL,
+        port=config.QDRANT_PORT,
+        grpc_port=config.QDRANT_GRPC_PORT,
+        prefer_grpc=config.QDRANT_PREFER_GRPC,
+        grpc_options=dict(QDRANT_GRPC_OPTIONS),
+        api_key=config.QDRANT_API_KEY,
+        check_compatibility=False,
+    )
+    vector_store = QdrantVectorStore(
+        client=qdrant_client,
+        index_name=config.COLLECTION_NAME,
+        embedder=embedder,
+    )
+    document_search = DocumentSearch(vector_store=vector_store, reranker=reranker)
+    return _Clients(
+        embedder=embedder,
+        reranker=reranker,
+        qdrant_client=qdrant_client,
+        vector_store=vector_store,
+        document_search=document_search,
+        llm=llm,
+    )
 
-    system_prompt = """
-    Your task is to rewrite the most recent user message so that
-    it is fully self-contained and understandable on its own.
-
-    You are provided with:
-    - The most recent user message ("Message").
-    - A list of previous messages ("History"), ordered from most recent to oldest.
-
-    If the latest message contains references to previous messages
-    (e.g., using pronouns like "he", "it", or phrases like "as I said earlier"),
-    you must resolve those references using the history.
-    When resolving ambiguous references,
-    always prefer the most recent applicable message.
-
-    Return ONLY the rewritten, self-contained version of the latest message.
 
-    Do NOT include the message history in your output.
-    Do NOT answer the message.
-    Do NOT change the meaning or add new information.
+async def warmup() -> None:
     """
+    Opens the connections to Qdrant and the LLM backend ahead of the first query,
+    so that it does not pay for DNS lookups and TLS handshakes.
 
-    user_prompt = """
-    Message:
-    {{ last_message }}
-
-    History:
-    {% for message in history[::-1] %}
-    - {{ message }}
-    {% endfor %}
+    Failures are only logged, as the clients reconnect on the next call anyway.
     """
-
-
-def prepare_context(context: Element) -> str:
-    text = (
-        f"{context.text_representation} "
-        f"(source: {context.document_meta.source.url}, "
-        f"page: {context.location.page_number})"
+    clients = get_clients()
+    results = await asyncio.gather(
+        clients.qdrant_client.get_collections(),
+        clients.llm.generate("ping", options=LiteLLMOptions(max_tokens=1)),
+        return_exceptions=True,
     )
-    return text
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Warm-up request failed: %s", result)
 
 
-async def get_contexts(
-    question: str, top_k: int, top_n: int
-) -> tuple[list[str], set[str]]:
+async def _get_contexts(
+    question: str, top_k: int, top_n: int | None = None
+) -> tuple[list[str], KeysView[str]]:
     """
     Retrieve the most relevant context documents for a given question
     using a vector store.
@@ -141,83 +132,144 @@ async def get_contexts(
             The question to search for relevant contexts.
         top_k (int):
             The number of top relevant contexts to retrieve from the vector store.
-        top_n (int):
+        top_n (int | None):
             The maximum number of reranked contexts to return
             after applying the reranker. The actual number returned may be fewer,
-            depending on relevance.
+            depending on relevance. If None, the reranker is skipped
+            and all top-k contexts are returned.
 
     Returns:
-        tuple[list[str], set[str]]: A tuple containing two elements:
+        tuple[list[str], KeysView[str]]: A tuple containing two elements:
             - A list of the top-k context strings.
-            - A set of unique sources (`set[str]`) corresponding to the context strings,
-            ensuring no duplicates.
+            - The unique sources corresponding to the context strings,
+            in the order in which they first appear among the contexts.
 
     Dependencies:
-        - LiteLLMEmbedder: Generates embeddings for the question.
-        - AsyncQdrantClient: Connects to the Qdrant vector store.
-        - QdrantVectorStore: Manages document storage and retrieval.
-        - DocumentSearch: Executes the search in the vector store.
-        - LiteLLMReranker: Reranks the retrieved contexts for better relevance.
+        - DocumentSearch: Executes the search in the vector store and reranks
+          the retrieved contexts, shared across calls (see `get_clients`).
+        - QdrantVectorStore: Queried directly when reranking is skipped.
     """
-    embedder = LiteLLMEmbedder(
-        model_name=config.EMBEDDING_MODEL,
-    )
-    reranker = LLMReranker(
-        model_name=config.MODEL_NAME,
-    )
+    clients = get_clients()
+    if top_n is None:
+        results = await clients.vector_store.retrieve(
+            question, VectorStoreOptions(k=top_k)
+        )
+        contexts = [
+            Element.from_vector_db_entry(result.entry, result.score)
+            for result in results
+        ]
+    else:
+        contexts = await clients.document_search.search(
+            question,
+            DocumentSearchOptions(
+                vector_store_options={"k": top_k},
+                reranker_options={"top_n": top_n},
+            ),
+        )
 
-    qdrant_client = AsyncQdrantClient(
-        url=config.QDRANT_URL,
-        port=config.QDRANT_PORT,
-        api_key=config.QDRANT_API_KEY,
-        check_compatibility=False,
-    )
-    vector_store = QdrantVectorStore(
-        client=qdrant_client,
-        index_name=config.COLLECTION_NAME,
-        embedder=embedder,
-    )
-    document_search = DocumentSearch(vector_store=vector_store, reranker=reranker)
-    contexts = await document_search.search(
-        question,
-        DocumentSearchOptions(
-            vector_store_options={"k": top_k},
-            reranker_options={"top_n": top_n},
-        ),
-    )
+    texts: list[str] = []
+    sources: dict[str, None] = {}
+    for context in contexts:
+        url = context.document_meta.source.url
+        texts.append(
+            f"{context.text_representation} "
+            f"(source: {url}, page: {context.location.page_number})"
+        )
+        sources[url] = None
+    return texts, sources.keys()
 
-    texts = [prepare_context(context) for context in contexts]
-    sources = set([context.document_meta.source.url for context in contexts])
-    return texts, sources
 
+@async_ttl_cache(max_size=config.QUERY_CACHE_SIZE, ttl=config.QUERY_CACHE_TTL)
+async def get_contexts(
+    question: str, top_k: int, top_n: int | None = None
+) -> tuple[list[str], KeysView[str]]:
+    """
+    Cached variant of `_get_contexts`, keyed by the question
+    and the retrieval parameters. Results expire after `QUERY_CACHE_TTL` seconds.
 
-async def inference(query_with_history: ChatFormat) -> AsyncGenerator[str, None]:
-    llm = LiteLLM(
-        model_name=config.MODEL_NAME,
-        api_key=config.OPENAI_API_KEY,
-        default_options=options,
-    )
+    Args:
+        question (str):
+            The question to search for relevant contexts.
+        top_k (int):
+            The number of top relevant contexts to retrieve from the vector store.
+        top_n (int | None):
+            The maximum number of reranked contexts to return,
+            or None to skip the reranker.
+
+    Returns:
+        tuple[list[str], KeysView[str]]: The context strings and their unique sources.
+    """
+    return await _get_contexts(question, top_k=top_k, top_n=top_n)
+
+
+async def compress_query(query_with_history: ChatFormat) -> str:
+    """
+    Rewrites the last user message into a standalone query using the history.
 
-    compressor = StandaloneMessageCompressor(llm=llm, prompt=CompressorPrompt)
-    query = await compressor.compress(query_with_history)
+    While the compressor LLM runs, the raw last message is embedded
+    in the background. If the compressor returns the message unchanged,
+    the retrieval reuses that embedding instead of waiting for a new one;
+    the caller has to discard it if the retrieval does not use it.
+
+    Args:
+        query_with_history (ChatFormat):
+            The conversation ending with the user message.
+
+    Returns:
+        str: The standalone query.
+    """
+    last_message = query_with_history[-1]["content"]
+    if len(query_with_history) == 1:
+        return last_message
+
+    clients = get_clients()
+    compressor = StandaloneMessageCompressor(llm=clients.llm, prompt=CompressorPrompt)
+    clients.embedder.prefetch(last_message)
+    try:
+        query = await compressor.compress(query_with_history)
+    except BaseException:
+        clients.embedder.discard(last_message)
+        raise
+
+    if query.strip() == last_message.strip():
+        return last_message
+    clients.embedder.discard(last_message)
+    return query
+
+
+async def inference(query_with_history: ChatFormat) -> AsyncGenerator[str, None]:
+    llm = get_clients().llm
+    query = await compress_query(query_with_history)
     logger.info(
-        f"Query: {query_with_history[-1]['content']} -- "
-        f"Compressed query: {query} -- "
-        f"Without history: {len(query_with_history) == 1}"
+        "Query: %s -- Compressed query: %s -- Without history: %s",
+        query_with_history[-1]["content"],
+        query,
+        len(query_with_history) == 1,
     )
 
-    context, sources = await get_contexts(query, top_k=config.TOP_K, top_n=config.TOP_N)
-    stream = llm.generate_streaming(
-        prompt=RAGPrompt(QueryWithContext(query=query, context=context)),
+    try:
+        context, sources = await get_contexts(
+            query, top_k=config.TOP_K, top_n=config.TOP_N
+        )
+    finally:
+        # A cache hit in `get_contexts` leaves the prefetched embedding unused.
+        get_clients().embedder.discard(query)
+    prompt_input = QueryWithContext.model_construct(
+        query=query, context_str="\n".join(context)
     )
-    async for chunk in stream:
+    stream = llm.generate_streaming(prompt=RAGPrompt(prompt_input))
+    async for chunk in batched_stream(
+        stream,
+        max_interval=config.STREAM_BATCH_INTERVAL,
+        max_chunks=config.STREAM_BATCH_SIZE,
+        max_chars=config.STREAM_BATCH_CHARS,
+    ):
         yield chunk
 
     if sources:
-        sources_str = "\n\nPowiązane materiały: \n" + "\n".join(
-            [f"- {source}" for source in sources]
+        yield "\n\nPowiązane materiały: \n" + "\n".join(
+            f"- {source}" for source in sources
         )
-        yield sources_str
 
 
 def parse_query() -> ChatFormat:
@@ -260,4 +312,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
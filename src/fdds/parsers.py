@@ -0,0 +1,104 @@
+import logging
+
+import pypdf
+from ragbits.document_search.documents.document import Document, DocumentType
+from ragbits.document_search.documents.element import (
+    Element,
+    ElementLocation,
+    TextElement,
+)
+from ragbits.document_search.ingestion.parsers.base import DocumentParser
+
+logger = logging.getLogger(__name__)
+
+
+def split_text(text: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """
+    Splits the text into overlapping chunks, breaking at spaces where possible.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): The maximum number of characters in a chunk.
+        chunk_overlap (int): The number of characters shared by consecutive chunks.
+
+    Returns:
+        list[str]: The chunks of the text.
+    """
+    chunks: list[str] = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            space = text.rfind(" ", start + chunk_overlap + 1, end)
+            if space != -1:
+                end = space
+        if chunk := text[start:end].strip():
+            chunks.append(chunk)
+        if end == len(text):
+            break
+        start = max(end - chunk_overlap, start + 1)
+    return chunks
+
+
+class PyPdfDocumentParser(DocumentParser):
+    """
+    Lightweight PDF parser extracting the text layer of each page with pypdf.
+
+    It is much faster than the layout-aware default parser, but skips
+    images and does no OCR, so scanned PDFs yield no text. With `ocr_fallback`,
+    such documents are parsed again with the Docling parser, which runs OCR;
+    otherwise they are only reported in the logs.
+    """
+
+    supported_document_types = {DocumentType.PDF}
+
+    def __init__(
+        self,
+        chunk_size: int = 800,
+        chunk_overlap: int = 100,
+        ocr_fallback: bool = True,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.ocr_fallback = ocr_fallback
+
+    async def parse(self, document: Document) -> list[Element]:
+        """
+        Extracts the text of the PDF and splits each page into chunks.
+
+        Args:
+            document (Document): The PDF document to parse.
+
+        Returns:
+            list[Element]: The text chunks, with their page numbers,
+                or the elements found by the OCR fallback.
+        """
+        self.validate_document_type(document.metadata.document_type)
+        reader = pypdf.PdfReader(document.local_path)
+        elements: list[Element] = []
+        for page_number, page in enumerate(reader.pages, start=1):
+            text = " ".join((page.extract_text() or "").split())
+            elements.extend(
+                TextElement(
+                    document_meta=document.metadata,
+                    location=ElementLocation(page_number=page_number),
+                    content=chunk,
+                )
+                for chunk in split_text(text, self.chunk_size, self.chunk_overlap)
+            )
+        if elements:
+            return elements
+
+        if not self.ocr_fallback:
+            logger.warning("No text layer, nothing ingested: %s", document.metadata.id)
+            return elements
+
+        logger.warning("No text layer, parsing with OCR: %s", document.metadata.id)
+        from ragbits.document_search.ingestion.parsers.docling import (
+            DoclingDocumentParser,
+        )
+
+        elements = await DoclingDocumentParser().parse(document)
+        if not elements:
+            logger.warning("No text found by OCR: %s", document.metadata.id)
+        return elements
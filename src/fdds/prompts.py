@@ -0,0 +1,99 @@
+from pydantic import BaseModel, ConfigDict
+from ragbits.chat.history.compressors.llm import LastMessageAndHistory
+from ragbits.core.prompt import Prompt
+
+
+class QueryWithContext(BaseModel):
+    """
+    Represents a query with associated context for
+    retrieval-augmented generation workflows.
+
+    This class models a user query along with the context strings joined
+    into a single block of text. The context provides relevant background
+    information that the assistant can use to generate a response.
+    It only carries trusted internal data, so it is built with
+    `model_construct`, skipping validation.
+
+    Attributes:
+        query (str): The user's question or input.
+        context_str (str):
+        The context strings containing information relevant to the query,
+        one per line.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    query: str
+    context_str: str
+
+
+class RAGPrompt(Prompt[QueryWithContext]):
+    """
+    A prompt template for a retrieval-augmented generation (RAG) assistant.
+
+    This class defines both the system and user prompts for guiding
+    the assistant's behavior. The assistant answers questions using
+    the provided context and refuses to answer
+    if the context lacks enough information.
+
+    Attributes:
+        system_prompt (str): The system-level instructions for the assistant.
+        user_prompt (str): The template for rendering the user's query and context.
+
+    """
+
+    system_prompt = """
+    You are a helpful assistant.
+    Answer the QUESTION that will be provided using CONTEXT.
+    If the QUESTION asks where something is located,
+    if possible, try to provide the file url.
+
+    DO NOT INFORM THAT INFORMATION IS PROVIDED IN CONTEXT!
+    If in the given CONTEXT there is not enough information refuse to answer.
+    """
+
+    user_prompt = """
+    QUESTION:
+    {{ query }}
+
+    CONTEXT:
+    {{ context_str }}
+    """
+
+
+class CompressorPrompt(Prompt[LastMessageAndHistory, str]):
+    """
+    A prompt for recontextualizing the last message in the history.
+    """
+
+    system_prompt = """
+    Your task is to rewrite the most recent user message so that
+    it is fully self-contained and understandable on its own.
+
+    You are provided with:
+    - The most recent user message ("Message").
+    - A list of previous messages ("History"), ordered from most recent to oldest.
+
+    If the latest message contains references to previous messages
+    (e.g., using pronouns like "he", "it", or phrases like "as I said earlier"),
+    you must resolve those references using the history.
+    When resolving ambiguous references,
+    always prefer the most recent applicable message.
+
+    Return ONLY the rewritten, self-contained version of the latest message.
+
+    Do NOT include the message history in your output.
+    Do NOT answer the message.
+    Do NOT change the meaning or add new information.
+    """
+
+    user_prompt = """
+    Message:
+    {{ last_message }}
+
+    History:
+    {% for message in history | reverse %}
+    - {{ message }}
+    {% endfor %}
+    """
@@ -1,6 +1,9 @@
+import asyncio
 import math
 from collections.abc import Sequence
+from pathlib import Path
 
+import numpy as np
 import tiktoken
 
 from ragbits.core.llms.litellm import LiteLLM, LiteLLMOptions
@@ -34,12 +37,16 @@ class LLMReranker(Reranker):
         prompt_template: str | None = None,
         reranker_options: RerankerOptions | None = None,
         llm_options: LiteLLMOptions | None = None,
+        llm: LiteLLM | None = None,
     ):
         self.reranker_options = reranker_options or self.reranker_default_options
         super().__init__(default_options=self.reranker_options)
         self.llm_options = llm_options or self.llm_default_options
         self.prompt_template = prompt_template or self.default_prompt_template
         self.model_name = model_name
+        self.llm = llm or LiteLLM(
+            model_name=self.model_name, default_options=self.llm_options
+        )
 
     async def rerank(
         self,
@@ -78,7 +85,6 @@ class LLMReranker(Reranker):
         """
         self.llm_options.logit_bias = self.get_yes_no_token_ids()
 
-        lite_llm = LiteLLM(model_name=self.model_name, default_options=self.llm_options)
         scored_elements = []
         for doc in elements:
             full_prompt = self.prompt_template.format(
@@ -86,7 +92,7 @@ class LLMReranker(Reranker):
             )
 
             prompt = SimplePrompt(content=full_prompt)
-            res = await lite_llm._call(prompt=prompt, options=self.llm_options)
+            res = await self.llm._call(prompt=prompt, options=self.llm_options)
             answer = res["response"]
             logprob = res["logprobs"][0]["logprob"]
             prob = math.exp(logprob) if answer == "Yes" else 0
@@ -100,3 +106,104 @@ class LLMReranker(Reranker):
         tokenizer = tiktoken.encoding_for_model(self.model_name)
         ids = [tokenizer.encode(token) for token in tokens]
         return {ids[0][0]: 1, ids[1][0]: 1}
+
+
+class ONNXReranker(Reranker):
+    """
+    Reranking algorithm for documents based on a cross-encoder model
+    (e.g. BAAI/bge-reranker-v2-m3) exported to ONNX and run locally.
+
+    All (query, document) pairs are scored in a single batched forward pass,
+    so reranking costs no LLM calls. The model directory must contain
+    `model.onnx` (optionally INT8-quantized) and `tokenizer.json`.
+    Requires the `onnx` extra (onnxruntime and tokenizers).
+    """
+
+    options_cls = RerankerOptions
+    reranker_default_options = RerankerOptions(top_n=5)
+    default_providers = ("CUDAExecutionProvider", "CPUExecutionProvider")
+
+    def __init__(
+        self,
+        model_path: str | Path,
+        reranker_options: RerankerOptions | None = None,
+        max_length: int = 512,
+        providers: Sequence[str] | None = None,
+    ):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self.reranker_options = reranker_options or self.reranker_default_options
+        super().__init__(default_options=self.reranker_options)
+        model_path = Path(model_path)
+        available_providers = onnxruntime.get_available_providers()
+        self.session = onnxruntime.InferenceSession(
+            str(model_path / "model.onnx"),
+            providers=[
+                provider
+                for provider in providers or self.default_providers
+                if provider in available_providers
+            ],
+        )
+        self.input_names = {node.name for node in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(str(model_path / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length)
+        self.tokenizer.enable_padding()
+
+    async def rerank(
+        self,
+        elements: Sequence[Sequence[Element]],
+        query: str,
+        options: RerankerOptions | None = None,
+    ) -> Sequence[Element]:
+        """Reranking the sequence of elements according to obtain scores.
+        Args:
+            elements: The sequence of the sequence of elements to rerank.
+            query: The query to score elements with.
+            options: The RerankerOptions to use for reranking.
+        Returns:
+            A sequence of elements.
+        """
+        reranker_options = (
+            (self.default_options | options) if options else self.default_options
+        )
+        flat_elements = [element for item in elements for element in item]
+        if not flat_elements:
+            return []
+        documents = [element.text_representation or "" for element in flat_elements]
+        scored_elements = await asyncio.to_thread(
+            self._score_documents, documents, query
+        )
+        scoring_results = list(zip(flat_elements, scored_elements, strict=True))
+        scoring_results.sort(key=lambda x: x[1], reverse=True)
+        if reranker_options.score_threshold:
+            scoring_results = [
+                result
+                for result in scoring_results
+                if result[1] >= reranker_options.score_threshold
+            ]
+        return [elem for elem, _ in scoring_results[: reranker_options.top_n or None]]
+
+    def _score_documents(self, documents: Sequence[str], query: str) -> list[float]:
+        """
+        Scoring the documents according to their relevance to the query
+        Args:
+            documents: The texts of the documents to score.
+            query: The query to score documents with.
+        Returns:
+            A list of relevance probabilities.
+        """
+        encodings = self.tokenizer.encode_batch(
+            [(query, document) for document in documents]
+        )
+        inputs = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array(
+                [e.attention_mask for e in encodings], dtype=np.int64
+            ),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        logits = self.session.run(
+            None, {name: inputs[name] for name in self.input_names}
+        )[0]
+        return (1 / (1 + np.exp(-logits.reshape(-1)))).tolist()
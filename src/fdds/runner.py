@@ -0,0 +1,25 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # e.g. on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs the coroutine like `asyncio.run`, on a uvloop event loop if available.
+
+    Args:
+        main (Coroutine): The coroutine to run.
+
+    Returns:
+        T: The result of the coroutine.
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
@@ -0,0 +1,138 @@
+import os
+import shutil
+from hashlib import blake2b
+from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
+import orjson
+from ragbits.core.sources.base import get_local_storage_dir
+from ragbits.core.sources.exceptions import SourceDownloadError, SourceNotFoundError
+from pydantic import computed_field
+from ragbits.core.sources.web import WebSource
+
+from fdds import config
+
+
+def get_http_cache_dir() -> Path:
+    """
+    Returns the directory with the files downloaded by `CachedWebSource`.
+
+    Returns:
+        Path: `HTTP_CACHE_DIR`, or `http_cache` in the ragbits storage directory.
+    """
+    return config.HTTP_CACHE_DIR or get_local_storage_dir() / "http_cache"
+
+
+def prune_http_cache(max_bytes: int) -> None:
+    """
+    Removes the least recently used files from the HTTP cache until
+    its total size does not exceed the limit.
+
+    Args:
+        max_bytes (int): The maximum total size of the cached files.
+    """
+    cache_dir = get_http_cache_dir()
+    if not cache_dir.is_dir():
+        return
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        if not entry.is_dir():
+            continue
+        size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+        entries.append((entry.stat().st_mtime, size, entry.path))
+        total += size
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+class CachedWebSource(WebSource):
+    """
+    Web source keeping downloaded files on disk between runs.
+
+    Each file is stored in `get_http_cache_dir()` together with the ETag and
+    Last-Modified headers of its response. Subsequent fetches send a conditional
+    GET and reuse the stored file when the server answers 304 Not Modified.
+    The cache is not bounded by itself, see `prune_http_cache`.
+
+    The source is serialized with the `source_type` of a plain `WebSource`,
+    so the stored documents do not depend on this class being importable
+    at retrieval time.
+    """
+
+    protocol = "cached_web"
+
+    @computed_field  # type: ignore[prop-decorator]
+    def source_type(self) -> str:
+        return WebSource.class_identifier()
+
+    def remove_cached(self) -> None:
+        """
+        Removes the cached file of the source, if any.
+        """
+        shutil.rmtree(self._cache_paths()[0].parent, ignore_errors=True)
+
+    def _cache_paths(self) -> tuple[Path, Path]:
+        """
+        Returns the paths of the cached file and of its response metadata.
+
+        Returns:
+            tuple[Path, Path]: The file path and the metadata path.
+        """
+        file_name = urlparse(self.url).path.rsplit("/", 1)[-1] or "index"
+        key = blake2b(self.url.encode(), digest_size=16).hexdigest()
+        cache_dir = get_http_cache_dir() / key
+        return cache_dir / file_name, cache_dir / "meta.json"
+
+    async def fetch(self) -> Path:
+        """
+        Downloads the file, unless the cached copy is still up to date.
+
+        Returns:
+            Path: The local path to the downloaded file.
+
+        Raises:
+            SourceDownloadError: If the download failed.
+            SourceNotFoundError: If the URL is invalid.
+        """
+        path, meta_path = self._cache_paths()
+        headers = dict(self.headers or {})
+        if path.exists() and meta_path.exists():
+            meta = orjson.loads(meta_path.read_bytes())
+            if etag := meta.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := meta.get("last_modified"):
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            async with aiohttp.ClientSession() as session, session.get(
+                self.url, headers=headers
+            ) as response:
+                if response.status == 304:
+                    os.utime(path.parent)
+                    return path
+                if not response.ok:
+                    raise SourceDownloadError(url=self.url, code=response.status)
+
+                path.parent.mkdir(parents=True, exist_ok=True)
+                partial_path = path.with_name(path.name + ".part")
+                with open(partial_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        f.write(chunk)
+                os.replace(partial_path, path)
+                meta_path.write_bytes(
+                    orjson.dumps(
+                        {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                        }
+                    )
+                )
+        except (aiohttp.ClientError, IsADirectoryError) as e:
+            raise SourceNotFoundError(self.id) from e
+
+        return path
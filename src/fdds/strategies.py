@@ -0,0 +1,97 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from ragbits.core.sources.base import Source
+from ragbits.document_search.documents.document import Document, DocumentMeta
+from ragbits.document_search.documents.element import Element
+from ragbits.document_search.ingestion.parsers.base import DocumentParser
+from ragbits.document_search.ingestion.parsers.router import DocumentParserRouter
+from ragbits.document_search.ingestion.strategies.batched import (
+    BatchedIngestStrategy,
+)
+
+
+def _parse_in_worker(parser: DocumentParser, document: Document) -> list[Element]:
+    """
+    Parses the document in a worker process.
+
+    Args:
+        parser (DocumentParser): The parser for the document type.
+        document (Document): The downloaded document.
+
+    Returns:
+        list[Element]: The elements extracted from the document.
+    """
+    return asyncio.run(parser.parse(document))
+
+
+class ParallelIngestStrategy(BatchedIngestStrategy):
+    """
+    Batched ingest strategy parsing the documents in a pool of worker processes.
+
+    The ragbits parsers partition PDFs synchronously, so documents parsed
+    concurrently on the event loop still run one after another. This strategy
+    downloads the documents on the event loop, as the batched strategy does,
+    and hands the CPU-bound parsing to `num_workers` processes. Enrichment
+    and indexing stay on the event loop.
+
+    The workers are started with `spawn`, as forking would copy the open
+    gRPC channels and event loop of the parent, and only once the first
+    document is parsed. Each of them imports ragbits and the parser models
+    on its own, so their number should be sized by the available memory.
+    `close` stops the workers; they are started again on the next parse.
+    """
+
+    def __init__(self, num_workers: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.num_workers = num_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def close(self) -> None:
+        """
+        Shuts down the worker processes, waiting for them in a thread
+        so that the event loop is not blocked while they exit.
+        """
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+
+    # The base class declares this a staticmethod, but it only ever calls it
+    # as `self._parse_document(...)`, so the bound method receives the same
+    # arguments and can reach the pool.
+    async def _parse_document(  # type: ignore[override]
+        self,
+        document: DocumentMeta | Document | Source,
+        parser_router: DocumentParserRouter,
+    ) -> list[Element]:
+        """
+        Downloads a single document and parses it in a worker process.
+
+        Args:
+            document (DocumentMeta | Document | Source): The document to parse.
+            parser_router (DocumentParserRouter): The document parser router to use.
+
+        Returns:
+            list[Element]: The elements extracted from the document.
+        """
+        if isinstance(document, Source):
+            document_meta = await DocumentMeta.from_source(document)
+        elif isinstance(document, DocumentMeta):
+            document_meta = document
+        else:
+            document_meta = document.metadata
+
+        parser = parser_router.get(document_meta.document_type)
+        parser.validate_document_type(document_meta.document_type)
+        fetched = await document_meta.fetch()
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _parse_in_worker, parser, fetched
+        )
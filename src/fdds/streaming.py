@@ -0,0 +1,83 @@
+import asyncio
+from collections.abc import AsyncIterable
+from typing import AsyncGenerator
+
+_END = object()
+
+
+async def batched_stream(
+    stream: AsyncIterable[str],
+    max_interval: float,
+    max_chunks: int | None = None,
+    max_chars: int | None = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Coalesce chunks of a text stream into larger batches.
+
+    Chunks are accumulated until `max_chunks` of them or `max_chars`
+    characters are buffered, or `max_interval` seconds have passed since
+    the first buffered chunk, whichever comes first. The remaining buffer
+    is always flushed when the underlying stream is exhausted.
+
+    The stream is consumed by a single background task feeding a queue,
+    so that it is always advanced within the same context. Streams keeping
+    context variables set across their yields, like the trace spans
+    of ragbits LLMs, would otherwise fail to reset them.
+
+    Args:
+        stream (AsyncIterable[str]):
+            The stream of text chunks to coalesce.
+        max_interval (float):
+            The maximum time in seconds a chunk may wait in the buffer.
+        max_chunks (int | None):
+            The maximum number of chunks joined into a single batch.
+        max_chars (int | None):
+            The number of buffered characters that triggers a flush.
+
+    Yields:
+        str: The concatenated text of each batch.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for chunk in stream:
+                queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(_END)
+
+    producer = asyncio.create_task(produce())
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline = 0.0
+    try:
+        while True:
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                continue
+
+            if chunk is _END:
+                await producer
+                break
+
+            if not buffer:
+                deadline = loop.time() + max_interval
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+            if (max_chunks is not None and len(buffer) >= max_chunks) or (
+                max_chars is not None and buffered_chars >= max_chars
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+    finally:
+        producer.cancel()
+
+    if buffer:
+        yield "".join(buffer)
@@ -0,0 +1,146 @@
+import asyncio
+
+from qdrant_client.models import (
+    Datatype,
+    OptimizersConfigDiff,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
+from ragbits.core.audit.traces import trace
+from ragbits.core.vector_stores.base import VectorStoreEntry
+from ragbits.core.vector_stores.qdrant import QdrantVectorStore
+
+QDRANT_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 10_000,
+    "grpc.max_send_message_length": 64 << 20,
+    "grpc.max_receive_message_length": 64 << 20,
+}
+
+
+class BulkQdrantVectorStore(QdrantVectorStore):
+    """
+    Qdrant vector store for bulk ingestion of dense embeddings.
+
+    The ragbits store calls the blocking `upload_points` on the event loop,
+    which opens its own connections, sends batches of 64 points one by one
+    and waits until the server has applied them. This store upserts batches
+    of `upload_batch_size` points through the shared async client instead,
+    with at most `upload_concurrency` requests in flight, and only waits
+    for the server to receive the points, so that concurrent ingest batches
+    keep embedding in the meantime. The last batch of each call is sent
+    once the others were received and waits until the server has applied
+    it, so that write errors are raised to the caller.
+
+    If `indexing_threshold` is given, a newly created collection uses it
+    instead of the server default, e.g. 0 to defer indexing of a bulk load.
+    With `quantize_int8`, a newly created collection keeps int8-quantized
+    vectors in RAM for search and the original vectors on disk for rescoring.
+    With `float16`, the server stores the original vectors in half precision,
+    halving their size. With `shard_number`, the collection is split into
+    that many shards, each with its own write-ahead log, so that concurrent
+    uploads do not contend on a single one.
+    """
+
+    def __init__(
+        self,
+        *args,
+        upload_batch_size: int,
+        upload_concurrency: int,
+        indexing_threshold: int | None = None,
+        quantize_int8: bool = False,
+        float16: bool = False,
+        shard_number: int | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.upload_batch_size = upload_batch_size
+        self._upload_semaphore = asyncio.Semaphore(upload_concurrency)
+        self.indexing_threshold = indexing_threshold
+        self.quantize_int8 = quantize_int8
+        self.float16 = float16
+        self.shard_number = shard_number
+        self._collection_lock = asyncio.Lock()
+
+    async def _ensure_collection(self, vector_size: int) -> None:
+        """
+        Creates the collection if it does not exist yet.
+
+        Args:
+            vector_size (int): The size of the stored embeddings.
+        """
+        async with self._collection_lock:
+            if not await self._client.collection_exists(self._index_name):
+                await self._client.create_collection(
+                    collection_name=self._index_name,
+                    shard_number=self.shard_number,
+                    vectors_config={
+                        self._vector_name: VectorParams(
+                            size=vector_size,
+                            distance=self._distance_method,
+                            on_disk=self.quantize_int8,
+                            datatype=Datatype.FLOAT16 if self.float16 else None,
+                        )
+                    },
+                    quantization_config=(
+                        ScalarQuantization(
+                            scalar=ScalarQuantizationConfig(
+                                type=ScalarType.INT8, quantile=0.99, always_ram=True
+                            )
+                        )
+                        if self.quantize_int8
+                        else None
+                    ),
+                    optimizers_config=(
+                        OptimizersConfigDiff(indexing_threshold=self.indexing_threshold)
+                        if self.indexing_threshold is not None
+                        else None
+                    ),
+                )
+
+    async def _upsert_batch(self, points: list[PointStruct], wait: bool) -> None:
+        async with self._upload_semaphore:
+            await self._client.upsert(
+                collection_name=self._index_name, points=points, wait=wait
+            )
+
+    async def store(self, entries: list[VectorStoreEntry]) -> None:
+        """
+        Embeds and upserts the entries to the Qdrant collection.
+
+        Args:
+            entries (list[VectorStoreEntry]): The entries to store.
+        """
+        with trace(
+            entries=entries,
+            index_name=self._index_name,
+            distance_method=self._distance_method,
+            embedder=repr(self._embedder),
+            embedding_type=self._embedding_type,
+        ):
+            if not entries:
+                return
+            embeddings = await self._create_embeddings(entries)
+            if not embeddings:
+                return
+
+            await self._ensure_collection(len(next(iter(embeddings.values()))))
+            points = [
+                PointStruct(
+                    id=str(entry.id),
+                    vector={self._vector_name: embeddings[entry.id]},
+                    payload=entry.model_dump(exclude_none=True, mode="json"),
+                )
+                for entry in entries
+                if entry.id in embeddings
+            ]
+            size = self.upload_batch_size
+            starts = range(0, len(points), size)
+            ends = range(size, len(points) + size, size)
+            *batches, last = [points[start:end] for start, end in zip(starts, ends)]
+            await asyncio.gather(
+                *(self._upsert_batch(batch, wait=False) for batch in batches)
+            )
+            await self._upsert_batch(last, wait=True)
@@ -1,105 +1,394 @@
 import asyncio
 import argparse
+import logging
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from pathlib import Path
 
+import aiofiles
+import aiohttp
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Filter, FieldCondition, MatchValue
-from ragbits.core.embeddings import LiteLLMEmbedder
-from ragbits.core.vector_stores.qdrant import QdrantVectorStore
+from qdrant_client.models import (
+    Filter,
+    FieldCondition,
+    MatchAny,
+    MatchValue,
+    OptimizersConfigDiff,
+)
 from ragbits.document_search import DocumentSearch
+from ragbits.document_search.ingestion.strategies.base import (
+    IngestDocumentResult,
+    IngestExecutionError,
+)
 from ragbits.core.sources.web import WebSource
 from ragbits.document_search.ingestion.enrichers import ElementEnricherRouter
+from ragbits.document_search.ingestion.parsers import DocumentParserRouter
+from ragbits.document_search.documents.document import DocumentType
 from ragbits.document_search.documents.element import ImageElement
 
 from fdds import config
+from fdds.embedders import ConcurrentLiteLLMEmbedder
 from fdds.handlers import NoImageIntermediateHandler
+from fdds.parsers import PyPdfDocumentParser
+from fdds.runner import run
+from fdds.sources import CachedWebSource, prune_http_cache
+from fdds.strategies import ParallelIngestStrategy
+from fdds.vector_stores import QDRANT_GRPC_OPTIONS, BulkQdrantVectorStore
 
+logger = logging.getLogger(__name__)
 
-async def ingest_pdf_documents(documents_path: str) -> None:
-    """
-    Ingest PDF documents from a local source into a vector store for searching.
+SOURCE_URL_KEY = "metadata.document_meta.source.url"
 
-    This function uses an async Qdrant client to perform ingestion of PDF documents.
-    The documents are embedded using a specified embedding model and stored in a Qdrant
-    vector store for efficient searching.
+INGEST_QUEUE_SIZE = 64
 
-    The function performs the following steps:
-    1. Initializes an embedder with a predefined model.
-    2. Sets up an asynchronous Qdrant client and a vector store.
-    3. Lists all PDF documents from a specified local path.
-    4. Validates that there are documents to ingest.
-    5. If documents are found, it asynchronously ingests them into the vector store.
+PDF_CONTENT_TYPES = ("application/pdf", "application/octet-stream")
 
-    Args:
-        documents_path (str):
-            Path to a .txt file containing URLs of PDF documents to process.
-
-    Raises:
-        ValueError: If no documents are found at the specified path.
 
-    Prints:
-        A message indicating the number of documents being ingested.
+@lru_cache(maxsize=1)
+def get_ingest_client() -> AsyncQdrantClient:
+    """
+    Builds the Qdrant client used for ingestion and deletion on first use
+    and returns the same instance afterwards, keeping its gRPC channel alive
+    between batches.
 
+    Returns:
+        AsyncQdrantClient: The shared Qdrant client.
     """
-    embedder = LiteLLMEmbedder(
-        model_name=config.EMBEDDING_MODEL,
-    )
-    qdrant_client = AsyncQdrantClient(
+    return AsyncQdrantClient(
         url=config.QDRANT_INGEST_URL,
         port=config.QDRANT_PORT,
+        grpc_port=config.QDRANT_GRPC_PORT,
+        prefer_grpc=config.QDRANT_PREFER_GRPC,
+        grpc_options=dict(QDRANT_GRPC_OPTIONS),
+        timeout=config.QDRANT_INGEST_TIMEOUT,
         api_key=config.QDRANT_API_KEY,
     )
-    vector_store = QdrantVectorStore(
-        client=qdrant_client,
+
+
+@lru_cache(maxsize=1)
+def get_ingest_document_search() -> DocumentSearch:
+    """
+    Builds the embedder, vector store and document search used for ingestion
+    on first use and returns the same instance afterwards, so that repeated
+    ingestions within one process share them and the Qdrant client.
+    Documents are parsed in `PARSE_WORKERS` processes, PDFs with the parser
+    selected by `PDF_PARSER`.
+
+    Returns:
+        DocumentSearch: The shared document search.
+    """
+    embedder = ConcurrentLiteLLMEmbedder(
+        model_name=config.EMBEDDING_MODEL,
+        batch_size=config.EMBEDDING_BATCH_SIZE,
+        concurrency=config.EMBEDDING_CONCURRENCY,
+    )
+    vector_store = BulkQdrantVectorStore(
+        client=get_ingest_client(),
         index_name=config.COLLECTION_NAME,
         embedder=embedder,
+        upload_batch_size=config.QDRANT_UPLOAD_BATCH_SIZE,
+        upload_concurrency=config.QDRANT_UPLOAD_CONCURRENCY,
+        indexing_threshold=0 if config.BULK_MODE else None,
+        quantize_int8=config.QDRANT_INT8_QUANTIZATION,
+        float16=config.QDRANT_FLOAT16_VECTORS,
+        shard_number=config.QDRANT_SHARD_NUMBER,
     )
     enricher_router = ElementEnricherRouter(
         {ImageElement: NoImageIntermediateHandler()}
     )
-    document_search = DocumentSearch(
+    parser_router = (
+        DocumentParserRouter(
+            {
+                DocumentType.PDF: PyPdfDocumentParser(
+                    ocr_fallback=config.PDF_OCR_FALLBACK
+                )
+            }
+        )
+        if config.PDF_PARSER == "pypdf"
+        else None
+    )
+    return DocumentSearch(
         vector_store=vector_store,
+        ingest_strategy=ParallelIngestStrategy(num_workers=config.PARSE_WORKERS),
+        parser_router=parser_router,
         enricher_router=enricher_router,
     )
 
-    with open(documents_path, "r") as f:
-        urls = f.read().splitlines()
-    documents = []
-    for url in urls:
-        documents.extend(await WebSource.list_sources(url))
 
-    if len(documents):
-        print(f"[Ingesting {len(documents)} documents]")
-        await document_search.ingest(documents)
-    else:
+async def read_urls(documents_path: Path) -> AsyncIterator[str]:
+    """
+    Reads the URLs listed in a .txt file without blocking the event loop.
+
+    Blank lines and lines starting with `#` are skipped,
+    and each URL is yielded only once, in the order of first appearance.
+
+    Args:
+        documents_path (Path):
+            Path to a .txt file containing one URL per line.
+
+    Yields:
+        str: The unique URLs.
+    """
+    seen: set[str] = set()
+    async with aiofiles.open(documents_path, "r") as f:
+        async for line in f:
+            url = line.strip()
+            if url and not url.startswith("#") and url not in seen:
+                seen.add(url)
+                yield url
+
+
+async def set_indexing_threshold(
+    qdrant_client: AsyncQdrantClient, threshold: int
+) -> None:
+    """
+    Sets the indexing threshold of the collection, if it exists.
+
+    A threshold of 0 disables building the HNSW index, so that bulk uploads
+    do not update it batch by batch. Restoring a positive threshold makes
+    Qdrant build the index once, in the background.
+
+    Args:
+        qdrant_client (AsyncQdrantClient): The Qdrant client.
+        threshold (int): The indexing threshold in kilobytes.
+    """
+    if await qdrant_client.collection_exists(config.COLLECTION_NAME):
+        await qdrant_client.update_collection(
+            collection_name=config.COLLECTION_NAME,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+
+
+async def is_ingested(qdrant_client: AsyncQdrantClient, url: str) -> bool:
+    """
+    Checks whether any chunk of the document under the URL is already stored.
+
+    Args:
+        qdrant_client (AsyncQdrantClient): The Qdrant client.
+        url (str): The URL of the document.
+
+    Returns:
+        bool: True if the collection contains points of the document.
+    """
+    points, _ = await qdrant_client.scroll(
+        collection_name=config.COLLECTION_NAME,
+        scroll_filter=Filter(
+            must=[FieldCondition(key=SOURCE_URL_KEY, match=MatchValue(value=url))]
+        ),
+        limit=1,
+        with_payload=False,
+        with_vectors=False,
+    )
+    return bool(points)
+
+
+async def is_pdf(session: aiohttp.ClientSession, url: str) -> bool:
+    """
+    Checks with a HEAD request whether the URL serves a PDF small enough to ingest.
+
+    Only a definite answer excludes the URL: a client error other than
+    405 or 501, another content type or a size above `MAX_PDF_BYTES`.
+    If the server does not support HEAD, fails, cannot be reached or omits
+    the headers, the URL is kept and left to the full download.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session.
+        url (str): The URL of the document.
+
+    Returns:
+        bool: False if the URL definitely does not serve an ingestible PDF,
+            True otherwise.
+    """
+    try:
+        async with session.head(url, allow_redirects=True) as response:
+            status = response.status
+            has_content_type = "Content-Type" in response.headers
+            content_type = response.content_type
+            content_length = response.content_length
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning("HEAD check failed for %s: %s", url, e)
+        return True
+    if 400 <= status < 500 and status != 405:
+        return False
+    if status >= 400:
+        return True
+    if has_content_type and content_type not in PDF_CONTENT_TYPES:
+        return False
+    return content_length is None or content_length <= config.MAX_PDF_BYTES
+
+
+async def ingest_pdf_documents(documents_path: Path) -> None:
+    """
+    Ingest PDF documents from a local source into a vector store for searching.
+
+    This function uses an async Qdrant client to perform ingestion of PDF documents.
+    The documents are embedded using a specified embedding model and stored in a Qdrant
+    vector store for efficient searching.
+
+    The function performs the following steps:
+    1. Gets the shared Qdrant client and document search
+       (see `get_ingest_document_search`).
+    2. Checks which URLs are already ingested, if enabled.
+    3. Checks the given URLs concurrently, at most `URL_FETCH_CONCURRENCY`
+       at a time, and puts their sources on a bounded queue.
+    4. Ingests the queued documents into the vector store in batches,
+       several at a time, while the remaining URLs are still being listed.
+       A document that fails to download or parse is logged and does not
+       stop the other batches.
+    5. Validates that all documents were ingested.
+
+    With `INCREMENTAL_INGEST` enabled, URLs whose documents are already
+    stored in the collection are skipped; changed documents have to be
+    deleted first. With `PDF_HEAD_CHECK` enabled, URLs reported by a HEAD
+    request to be missing, to serve something else than a PDF, or a file
+    larger than `MAX_PDF_BYTES`, are skipped before downloading. With `BULK_MODE`
+    enabled, HNSW indexing of the collection is disabled for the duration
+    of the ingestion and restored afterwards. Finally, the HTTP cache
+    of downloaded PDFs is pruned to `HTTP_CACHE_MAX_BYTES`.
+
+    Args:
+        documents_path (Path):
+            Path to a .txt file containing URLs of PDF documents to process.
+
+    Raises:
+        IngestExecutionError: If any document failed, after all the others
+            were ingested.
+        ValueError: If no documents are found at the specified path.
+
+    Logs:
+        A message indicating the number of documents in each ingested batch.
+
+    """
+    qdrant_client = get_ingest_client()
+    document_search = get_ingest_document_search()
+
+    queue: asyncio.Queue[WebSource | None] = asyncio.Queue(INGEST_QUEUE_SIZE)
+    semaphore = asyncio.Semaphore(config.URL_FETCH_CONCURRENCY)
+    check_ingested = (
+        config.INCREMENTAL_INGEST
+        and await qdrant_client.collection_exists(config.COLLECTION_NAME)
+    )
+    already_ingested = 0
+
+    async def list_sources(session: aiohttp.ClientSession, url: str) -> None:
+        nonlocal already_ingested
+        async with semaphore:
+            if check_ingested and await is_ingested(qdrant_client, url):
+                already_ingested += 1
+                logger.info("Already ingested: %s", url)
+                return
+            if config.PDF_HEAD_CHECK and not await is_pdf(session, url):
+                logger.info("Not a PDF or too large: %s", url)
+                return
+        # Listing a web source only wraps the URL, without any request,
+        # so the concurrency only pays off for the checks above.
+        # Download failures are reported by the ingest batches.
+        for source in await CachedWebSource.list_sources(url):
+            await queue.put(source)
+
+    async def produce() -> None:
+        connector = aiohttp.TCPConnector(limit=config.URL_FETCH_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            connector=connector
+        ) as session, asyncio.TaskGroup() as listing:
+            async for url in read_urls(documents_path):
+                listing.create_task(list_sources(session, url))
+        # Only signal the end on success: if the consumer failed, nothing
+        # drains the full queue anymore and the put would never return.
+        await queue.put(None)
+
+    ingest_semaphore = asyncio.Semaphore(config.INGEST_CONCURRENCY)
+
+    ingested = 0
+    failed: list[IngestDocumentResult] = []
+
+    async def ingest(batch: list[WebSource]) -> None:
+        nonlocal ingested
+        try:
+            logger.info("Ingesting %d documents", len(batch))
+            result = await document_search.ingest(batch, fail_on_error=False)
+        finally:
+            ingest_semaphore.release()
+        ingested += len(result.successful)
+        for document in result.failed:
+            logger.error(
+                "Failed to ingest %s: %s",
+                document.document_uri,
+                document.error.message if document.error else "unknown error",
+            )
+        failed.extend(result.failed)
+
+    async def consume() -> None:
+        batch: list[WebSource] = []
+        async with asyncio.TaskGroup() as ingesting:
+            while (source := await queue.get()) is not None:
+                batch.append(source)
+                if len(batch) >= config.INGEST_BATCH_SIZE:
+                    await ingest_semaphore.acquire()
+                    ingesting.create_task(ingest(batch))
+                    batch = []
+            if batch:
+                await ingest_semaphore.acquire()
+                ingesting.create_task(ingest(batch))
+
+    if config.BULK_MODE:
+        await set_indexing_threshold(qdrant_client, 0)
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            group.create_task(consume())
+    finally:
+        if isinstance(document_search.ingest_strategy, ParallelIngestStrategy):
+            await document_search.ingest_strategy.close()
+        if config.BULK_MODE:
+            await set_indexing_threshold(qdrant_client, config.INDEXING_THRESHOLD)
+
+    if config.HTTP_CACHE_MAX_BYTES is not None:
+        await asyncio.to_thread(prune_http_cache, config.HTTP_CACHE_MAX_BYTES)
+
+    if failed:
+        logger.error("Ingested %d documents, %d failed", ingested, len(failed))
+        raise IngestExecutionError(failed)
+    if not ingested and not already_ingested:
         raise ValueError("No documents to ingest.")
 
 
-async def delete_url(qdrant_client, url):
+async def delete_pdf_documents(documents_path: Path) -> None:
+    urls = [url async for url in read_urls(documents_path)]
+    if not urls:
+        return
+    qdrant_client = get_ingest_client()
     filter_condition = Filter(
-        must=[
-            FieldCondition(
-                key="metadata.document_meta.source.url", match=MatchValue(value=url)
-            )
-        ]
+        must=[FieldCondition(key=SOURCE_URL_KEY, match=MatchAny(any=urls))]
     )
     try:
         await qdrant_client.delete(
             collection_name=config.COLLECTION_NAME, points_selector=filter_condition
         )
-        print(f"Deleted: {url}")
+        for url in urls:
+            CachedWebSource(url=url).remove_cached()
+            logger.info("Deleted: %s", url)
     except Exception as e:
-        print(f"Error deleting {url}: {e}")
+        logger.error("Error deleting %d URLs: %s", len(urls), e)
 
 
-async def delete_pdf_documents(documents_path: str) -> None:
-    with open(documents_path, "r") as f:
-        urls = f.read().splitlines()
-    qdrant_client = AsyncQdrantClient(
-        url=config.QDRANT_INGEST_URL,
-        port=config.QDRANT_PORT,
-        api_key=config.QDRANT_API_KEY,
-    )
-    await asyncio.gather(*(delete_url(qdrant_client, url) for url in urls))
+def existing_file(path: str) -> Path:
+    """
+    Resolves a command line argument to the path of an existing file.
+
+    Args:
+        path (str): The path given on the command line.
+
+    Returns:
+        Path: The absolute path to the file.
+
+    Raises:
+        argparse.ArgumentTypeError: If the path is not an existing file.
+    """
+    resolved = Path(path).resolve()
+    if not resolved.is_file():
+        raise argparse.ArgumentTypeError(f"{path} is not an existing file")
+    return resolved
 
 
 def main():
@@ -116,20 +405,26 @@ def main():
     group.add_argument(
         "--ingest",
         "-i",
+        type=existing_file,
         help="Path to a .txt file with URLs of PDF documents to ingest.",
     )
     group.add_argument(
         "--delete",
         "-d",
+        type=existing_file,
         help="Path to a .txt file with URLs of PDF documents to delete.",
     )
 
     args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
 
     if args.ingest:
-        asyncio.run(ingest_pdf_documents(args.ingest))
+        run(ingest_pdf_documents(args.ingest))
     elif args.delete:
-        asyncio.run(delete_pdf_documents(args.delete))
+        run(delete_pdf_documents(args.delete))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import os
+
+# `fdds` validates its configuration on import, which requires the API keys.
+for key in ("OPENAI_API_KEY", "NEPTUNE_API_KEY", "QDRANT_API_KEY"):
+    os.environ.setdefault(key, "test")
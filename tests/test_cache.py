@@ -0,0 +1,73 @@
+import asyncio
+
+from fdds import cache
+from fdds.cache import LRUCache, TTLCache, async_ttl_cache, conversation_key
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru: LRUCache[str, int] = LRUCache(max_size=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_lru_cache_overwrites_existing_key():
+    lru: LRUCache[str, int] = LRUCache(max_size=2)
+    lru.set("a", 1)
+    lru.set("a", 2)
+    assert lru.get("a") == 2
+    assert len(lru) == 1
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    ttl: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    ttl.set("a", 1)
+    now = 109.0
+    assert ttl.get("a") == 1
+    now = 110.0
+    assert ttl.get("a") is None
+    assert len(ttl) == 0
+
+
+def test_async_ttl_cache_reuses_results():
+    calls = []
+
+    @async_ttl_cache(max_size=8, ttl=60)
+    async def square(x: int, offset: int = 0) -> int:
+        calls.append((x, offset))
+        return x * x + offset
+
+    async def run() -> list[int]:
+        return [
+            await square(2),
+            await square(2),
+            await square(2, offset=1),
+            await square(3),
+            await square(2, offset=1),
+        ]
+
+    assert asyncio.run(run()) == [4, 4, 5, 9, 5]
+    assert calls == [(2, 0), (2, 1), (3, 0)]
+
+
+def test_conversation_key_is_stable():
+    conversation = [
+        {"role": "user", "content": "Cześć"},
+        {"role": "assistant", "content": "Dzień dobry"},
+    ]
+    reordered = [{"content": m["content"], "role": m["role"]} for m in conversation]
+    assert conversation_key(conversation) == conversation_key(reordered)
+
+
+def test_conversation_key_depends_on_content():
+    first = [{"role": "user", "content": "a"}]
+    second = [{"role": "user", "content": "b"}]
+    assert conversation_key(first) != conversation_key(second)
+    assert conversation_key(first) != conversation_key([*first, *first])
@@ -0,0 +1,53 @@
+import asyncio
+
+from ragbits.core.embeddings import LiteLLMEmbedder
+
+from fdds.embedders import QueryEmbedder
+
+
+def make_embedder(monkeypatch) -> tuple[QueryEmbedder, list[list[str]]]:
+    calls: list[list[str]] = []
+
+    async def embed_text(self, data, options=None):
+        calls.append(data)
+        return [[float(len(text)), 0.1] for text in data]
+
+    monkeypatch.setattr(LiteLLMEmbedder, "embed_text", embed_text)
+    return QueryEmbedder(cache_size=8, cache_ttl=60), calls
+
+
+def test_prefetched_embedding_is_reused(monkeypatch):
+    embedder, calls = make_embedder(monkeypatch)
+
+    async def run() -> list[list[float]]:
+        embedder.prefetch("query")
+        return await embedder.embed_text(["query"])
+
+    assert asyncio.run(run()) == [[5.0, 0.1]]
+    assert calls == [["query"]]
+    assert not embedder._prefetched
+
+
+def test_discard_drops_unused_prefetch(monkeypatch):
+    embedder, _ = make_embedder(monkeypatch)
+
+    async def run() -> None:
+        embedder.prefetch("query")
+        await asyncio.sleep(0)
+        embedder.discard("query")
+
+    asyncio.run(run())
+    assert not embedder._prefetched
+
+
+def test_repeated_queries_are_cached(monkeypatch):
+    embedder, calls = make_embedder(monkeypatch)
+
+    async def run() -> tuple[list[list[float]], list[list[float]]]:
+        return await embedder.embed_text(["query"]), await embedder.embed_text(
+            ["query"]
+        )
+
+    first, second = asyncio.run(run())
+    assert calls == [["query"]]
+    assert second == first == [[5.0, 0.1]]
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+
+import aiohttp
+import pytest
+from aiohttp import web
+from ragbits.document_search.ingestion.strategies.base import (
+    IngestDocumentResult,
+    IngestError,
+    IngestExecutionError,
+    IngestExecutionResult,
+)
+
+import manage_pdfs
+from fdds import config
+
+BAD_URL = "https://example.com/bad.pdf"
+
+
+class FakeDocumentSearch:
+    def __init__(self):
+        self.ingest_strategy = None
+        self.ingested: list[str] = []
+
+    async def ingest(self, sources, fail_on_error=True):
+        result = IngestExecutionResult()
+        for source in sources:
+            if source.url == BAD_URL:
+                error = IngestError(ValueError, "download failed", "")
+                result.failed.append(IngestDocumentResult(source.id, error=error))
+            else:
+                self.ingested.append(source.url)
+                result.successful.append(IngestDocumentResult(source.id, 1))
+        await asyncio.sleep(0)
+        return result
+
+
+def test_failed_document_does_not_stop_ingestion(tmp_path, monkeypatch, caplog):
+    urls = [f"https://example.com/{i}.pdf" for i in range(20)]
+    documents_path = tmp_path / "pdfs.txt"
+    documents_path.write_text("\n".join([*urls[:3], BAD_URL, *urls[3:]]))
+    document_search = FakeDocumentSearch()
+    monkeypatch.setattr(
+        manage_pdfs, "get_ingest_document_search", lambda: document_search
+    )
+    monkeypatch.setattr(config, "INGEST_BATCH_SIZE", 4)
+    monkeypatch.setattr(config, "PDF_HEAD_CHECK", False)
+    monkeypatch.setattr(config, "INCREMENTAL_INGEST", False)
+    monkeypatch.setattr(config, "BULK_MODE", False)
+    monkeypatch.setattr(config, "HTTP_CACHE_MAX_BYTES", None)
+
+    with caplog.at_level(logging.ERROR), pytest.raises(IngestExecutionError) as e:
+        asyncio.run(manage_pdfs.ingest_pdf_documents(documents_path))
+
+    assert sorted(document_search.ingested) == sorted(urls)
+    assert [result.document_uri for result in e.value.results] == [f"web:{BAD_URL}"]
+    assert f"Failed to ingest web:{BAD_URL}: download failed" in caplog.text
+
+
+def respond(status: int = 200, headers: dict[str, str] | None = None, delay=0.0):
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        response = web.Response(status=status, headers=headers)
+        if not headers or "Content-Type" not in headers:
+            response.content_type = None
+        return response
+
+    return handler
+
+
+async def check_head(handler, timeout: float = 5) -> bool:
+    app = web.Application()
+    app.router.add_route("HEAD", "/doc.pdf", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/doc.pdf"
+    try:
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as session:
+            return await manage_pdfs.is_pdf(session, url)
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.parametrize(
+    ("handler", "expected"),
+    [
+        (respond(headers={"Content-Type": "application/pdf"}), True),
+        (respond(headers={"Content-Type": "application/octet-stream"}), True),
+        (respond(headers={"Content-Type": "text/html"}), False),
+        (respond(), True),
+        (respond(404), False),
+        (respond(410), False),
+        (respond(405), True),
+        (respond(500), True),
+        (respond(501), True),
+    ],
+    ids=[
+        "pdf",
+        "octet-stream",
+        "html",
+        "no-headers",
+        "404",
+        "410",
+        "405",
+        "500",
+        "501",
+    ],
+)
+def test_is_pdf(handler, expected):
+    assert asyncio.run(check_head(handler)) is expected
+
+
+def test_is_pdf_rejects_oversized_files(monkeypatch):
+    monkeypatch.setattr(config, "MAX_PDF_BYTES", 10)
+    headers = {"Content-Type": "application/pdf", "Content-Length": "11"}
+    assert asyncio.run(check_head(respond(headers=headers))) is False
+
+
+def test_is_pdf_keeps_urls_on_timeout():
+    assert asyncio.run(check_head(respond(delay=1), timeout=0.05)) is True
+
+
+def test_is_pdf_keeps_unreachable_urls():
+    async def run() -> bool:
+        async with aiohttp.ClientSession() as session:
+            return await manage_pdfs.is_pdf(session, "http://127.0.0.1:1/doc.pdf")
+
+    assert asyncio.run(run()) is True
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+import pypdf
+from ragbits.document_search.documents.document import DocumentMeta
+
+from fdds.parsers import PyPdfDocumentParser, split_text
+
+
+def test_short_text_is_a_single_chunk():
+    assert split_text("Ala ma kota", chunk_size=800, chunk_overlap=100) == [
+        "Ala ma kota"
+    ]
+
+
+def test_empty_text_has_no_chunks():
+    assert split_text("", chunk_size=800, chunk_overlap=100) == []
+    assert split_text("   ", chunk_size=800, chunk_overlap=100) == []
+
+
+def test_chunks_respect_size_and_break_at_spaces():
+    text = " ".join(f"word{i}" for i in range(200))
+    chunks = split_text(text, chunk_size=50, chunk_overlap=10)
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert all(not chunk.startswith(" ") for chunk in chunks)
+    assert chunks[0].split()[-1] == "word7"
+    assert chunks[-1].endswith("word199")
+
+
+def test_consecutive_chunks_overlap():
+    text = " ".join(f"word{i}" for i in range(50))
+    chunks = split_text(text, chunk_size=40, chunk_overlap=15)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous[-5:] in current
+
+
+def test_text_without_spaces_is_split_at_chunk_size():
+    chunks = split_text("a" * 25, chunk_size=10, chunk_overlap=3)
+    assert chunks[0] == "a" * 10
+    assert "".join(chunks).count("a") >= 25
+    assert all(len(chunk) <= 10 for chunk in chunks)
+
+
+def test_pdf_without_text_layer_is_reported(tmp_path, caplog):
+    path = tmp_path / "scan.pdf"
+    writer = pypdf.PdfWriter()
+    writer.add_blank_page(width=595, height=842)
+    writer.write(path)
+    document = asyncio.run(DocumentMeta.from_local_path(path).fetch())
+
+    parser = PyPdfDocumentParser(ocr_fallback=False)
+    with caplog.at_level(logging.WARNING, logger="fdds.parsers"):
+        elements = asyncio.run(parser.parse(document))
+
+    assert elements == []
+    assert "No text layer" in caplog.text
@@ -0,0 +1,71 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from fdds.streaming import batched_stream
+
+current_span: ContextVar[str | None] = ContextVar("current_span", default=None)
+
+
+async def stream(chunks: list[str], delay: float = 0) -> None:
+    for chunk in chunks:
+        await asyncio.sleep(delay)
+        yield chunk
+
+
+async def traced_stream(chunks: list[str]) -> None:
+    token = current_span.set("generate")
+    try:
+        for chunk in chunks:
+            await asyncio.sleep(0.001)
+            yield chunk
+    finally:
+        current_span.reset(token)
+
+
+async def collect(batches) -> list[str]:
+    return [batch async for batch in batches]
+
+
+def test_batches_by_chunk_count():
+    batches = batched_stream(stream(list("abcde")), max_interval=10, max_chunks=2)
+    assert asyncio.run(collect(batches)) == ["ab", "cd", "e"]
+
+
+def test_batches_by_char_count():
+    batches = batched_stream(
+        stream(["abc", "d", "efgh", "i"]), max_interval=10, max_chars=4
+    )
+    assert asyncio.run(collect(batches)) == ["abcd", "efgh", "i"]
+
+
+def test_flushes_after_max_interval():
+    batches = batched_stream(
+        stream(["a", "b", "c"], delay=0.05), max_interval=0.01, max_chunks=10
+    )
+    assert asyncio.run(collect(batches)) == ["a", "b", "c"]
+
+
+def test_empty_stream():
+    batches = batched_stream(stream([]), max_interval=10)
+    assert asyncio.run(collect(batches)) == []
+
+
+def test_stream_with_context_variables():
+    batches = batched_stream(
+        traced_stream(list("abcdef")), max_interval=0.002, max_chunks=4
+    )
+    assert "".join(asyncio.run(collect(batches))) == "abcdef"
+
+
+def test_propagates_stream_errors():
+    async def failing_stream():
+        yield "a"
+        raise RuntimeError("stream failed")
+
+    async def run() -> list[str]:
+        return await collect(batched_stream(failing_stream(), max_interval=10))
+
+    with pytest.raises(RuntimeError, match="stream failed"):
+        asyncio.run(run())
@@ -0,0 +1,66 @@
+import asyncio
+import uuid
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from ragbits.core.embeddings import LiteLLMEmbedder
+from ragbits.core.vector_stores.base import VectorStoreEntry
+
+from fdds.vector_stores import BulkQdrantVectorStore
+
+
+class FakeEmbedder(LiteLLMEmbedder):
+    def __init__(self, size: int):
+        super().__init__(model_name="fake")
+        self.size = size
+
+    async def embed_text(self, data, options=None):
+        return [[1.0, *([float(i)] * (self.size - 1))] for i, _ in enumerate(data)]
+
+
+def make_entries(count: int) -> list[VectorStoreEntry]:
+    return [
+        VectorStoreEntry(id=uuid.uuid4(), text=f"text {i}", metadata={})
+        for i in range(count)
+    ]
+
+
+def make_store(client: AsyncQdrantClient, size: int = 3) -> BulkQdrantVectorStore:
+    return BulkQdrantVectorStore(
+        client=client,
+        index_name="test",
+        embedder=FakeEmbedder(size),
+        upload_batch_size=3,
+        upload_concurrency=2,
+    )
+
+
+def test_store_waits_for_the_last_batch_only(monkeypatch):
+    client = AsyncQdrantClient(location=":memory:")
+    upsert = client.upsert
+    waits: list[tuple[int, bool]] = []
+
+    async def record(collection_name, points, wait):
+        waits.append((len(points), wait))
+        return await upsert(collection_name=collection_name, points=points, wait=wait)
+
+    monkeypatch.setattr(client, "upsert", record)
+
+    async def run() -> int:
+        await make_store(client).store(make_entries(10))
+        return (await client.count("test")).count
+
+    assert asyncio.run(run()) == 10
+    assert sorted(waits[:-1]) == [(3, False)] * 3
+    assert waits[-1] == (1, True)
+
+
+def test_store_raises_write_errors():
+    client = AsyncQdrantClient(location=":memory:")
+
+    async def run() -> None:
+        await make_store(client, size=3).store(make_entries(2))
+        await make_store(client, size=4).store(make_entries(2))
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())